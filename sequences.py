@@ -0,0 +1,216 @@
+import math
+
+import numpy as np
+import streamlit as st
+
+try:
+    import numba
+except ImportError:  # Numba is optional; NumPy's cumulative product is used instead
+    numba = None
+
+# Sequences are pure functions of their inputs, so cached results stay valid for a day
+CACHE_TTL = 24 * 60 * 60
+
+def generate_arithmetic_sequence(first_term, common_difference, num_terms):
+    """
+    Generate an arithmetic sequence given first term, common difference, and number of terms.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_difference (float): The common difference between consecutive terms
+        num_terms (int): The number of terms to generate
+    
+    Returns:
+        numpy.ndarray: The arithmetic sequence as an array of floats
+    """
+    if num_terms <= 0:
+        return np.empty(0, dtype=np.float64)
+    
+    return first_term + np.arange(num_terms, dtype=np.float64) * common_difference
+
+def _geometric_kernel(first_term, common_ratio, num_terms):
+    """
+    Fill an array with the recurrence a, a*r, a*r^2, ... using one multiply per term.
+    Compiled with Numba when it is installed.
+    """
+    sequence = np.empty(num_terms, dtype=np.float64)
+    sequence[0] = first_term
+    for i in range(1, num_terms):
+        sequence[i] = sequence[i - 1] * common_ratio
+    return sequence
+
+if numba is not None:
+    _geometric_kernel = numba.njit(cache=True)(_geometric_kernel)
+    _geometric_kernel(1.0, 1.0, 2)  # Compile at import so the first request doesn't pay the JIT cost
+
+def generate_geometric_sequence(first_term, common_ratio, num_terms):
+    """
+    Generate a geometric sequence given first term, common ratio, and number of terms.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_ratio (float): The common ratio between consecutive terms
+        num_terms (int): The number of terms to generate
+    
+    Returns:
+        numpy.ndarray: The geometric sequence as an array of floats
+    """
+    if num_terms <= 0:
+        return np.empty(0, dtype=np.float64)
+    
+    if numba is not None:
+        sequence = _geometric_kernel(float(first_term), float(common_ratio), int(num_terms))
+    else:
+        # Running product of the ratio: n-1 multiplies instead of n calls to pow
+        sequence = np.full(num_terms, common_ratio, dtype=np.float64)
+        sequence[0] = first_term
+        # Overflowing terms become inf by design, as they do on the Numba path
+        with np.errstate(over="ignore"):
+            sequence = np.multiply.accumulate(sequence)
+    return sequence
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def calculate_arithmetic_sum(first_term, common_difference, num_terms):
+    """
+    Calculate the sum of an arithmetic series using the formula: S_n = n/2 * (2a + (n-1)d)
+    """
+    if num_terms <= 0:
+        return 0
+    return num_terms / 2 * (2 * first_term + (num_terms - 1) * common_difference)
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def calculate_geometric_sum(first_term, common_ratio, num_terms):
+    """
+    Calculate the sum of a geometric series using the formula:
+    - If r = 1: S_n = n * a
+    - If r ≠ 1: S_n = a * (1 - r^n) / (1 - r)
+    
+    For 0.5 <= r < 2 (where r - 1 is exact) the numerator is evaluated as
+    expm1(n * log1p(r - 1)) so that ratios close to 1 do not lose precision to
+    cancellation in 1 - r^n.
+    """
+    if num_terms <= 0 or first_term == 0:
+        return 0
+    
+    if common_ratio == 1:
+        return num_terms * first_term
+    
+    try:
+        if 0.5 <= common_ratio < 2:
+            numerator = -math.expm1(num_terms * math.log1p(common_ratio - 1))
+        else:
+            numerator = 1 - math.pow(common_ratio, num_terms)
+    except OverflowError:
+        # r^n is beyond float range; its sign alternates for negative ratios
+        numerator = -math.inf if common_ratio > 0 or num_terms % 2 == 0 else math.inf
+    
+    return first_term * numerator / (1 - common_ratio)
+
+def calculate_arithmetic_summary(first_term, common_difference, num_terms):
+    """
+    Calculate the last term and range of an arithmetic sequence without generating it.
+    
+    Returns:
+        tuple: (last_term, range) where last_term = a + (n-1)d and range = |(n-1)d|
+    """
+    if num_terms <= 0:
+        return 0, 0
+    return first_term + (num_terms - 1) * common_difference, abs((num_terms - 1) * common_difference)
+
+def calculate_geometric_summary(first_term, common_ratio, num_terms):
+    """
+    Calculate the last term and range of a geometric sequence without generating it.
+    
+    For r >= 0 the sequence is monotone, so the range is |last - first|. For r < 0 the
+    terms alternate in sign and the extremes are the two largest-magnitude terms: the
+    last two when |r| >= 1, otherwise the first two.
+    
+    Returns:
+        tuple: (last_term, range)
+    """
+    if num_terms <= 0 or first_term == 0:
+        return 0, 0
+    
+    try:
+        last_term = first_term * math.pow(common_ratio, num_terms - 1)
+    except OverflowError:
+        last_term = first_term * (math.inf if common_ratio > 0 or num_terms % 2 == 1 else -math.inf)
+    
+    if num_terms == 1:
+        return last_term, 0
+    if common_ratio >= 0:
+        return last_term, abs(last_term - first_term)
+    if common_ratio > -1:
+        return last_term, abs(first_term) * (1 - common_ratio)
+    return last_term, abs(last_term) * (1 - 1 / common_ratio)
+
+def format_sequence_display(sequence):
+    """
+    Format the sequence for display with proper number formatting.
+    
+    Args:
+        sequence (numpy.ndarray): Array of numbers in the sequence
+    
+    Returns:
+        str: Formatted string representation of the sequence
+    """
+    if len(sequence) == 0:
+        return "No terms to display"
+    
+    # Format numbers to remove unnecessary decimal places; tolist() unboxes to native floats up front
+    formatted_terms = [
+        str(int(term)) if term.is_integer() else f"{term:.6g}"  # Use general format to avoid too many decimals
+        for term in np.asarray(sequence, dtype=np.float64).tolist()
+    ]
+    
+    return ", ".join(formatted_terms)
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def generate_formatted_sequence(sequence_type, first_term, second_param, num_terms):
+    """
+    Generate and format a sequence in one step, cached on the input parameters.
+    
+    Keying the cache on the scalar inputs rather than the generated array means a
+    cache hit never has to hash the full sequence.
+    
+    Args:
+        sequence_type (str): "Arithmetic" or "Geometric"
+        first_term (float): The first term of the sequence
+        second_param (float): The common difference or common ratio
+        num_terms (int): The number of terms to generate
+    
+    Returns:
+        str: Formatted string representation of the sequence
+    """
+    if sequence_type == "Arithmetic":
+        sequence = generate_arithmetic_sequence(first_term, second_param, num_terms)
+    else:
+        sequence = generate_geometric_sequence(first_term, second_param, num_terms)
+    return format_sequence_display(sequence)
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_download_text(sequence_type, first_term, second_param, num_terms, formatted_sequence, calculated_sum):
+    """
+    Build the plain-text contents of the sequence download file.
+    
+    Args:
+        sequence_type (str): "Arithmetic" or "Geometric"
+        first_term (float): The first term of the sequence
+        second_param (float): The common difference or common ratio
+        num_terms (int): The number of terms in the sequence
+        formatted_sequence (str): The sequence as returned by format_sequence_display
+        calculated_sum (float): The sum of the series
+    
+    Returns:
+        str: The download file contents
+    """
+    param_label = "Common Difference" if sequence_type == "Arithmetic" else "Common Ratio"
+    return "\n".join([
+        f"{sequence_type} Sequence",
+        f"First Term: {first_term:.6g}",
+        f"{param_label}: {second_param:.6g}",
+        f"Number of Terms: {num_terms}",
+        f"Sequence: {formatted_sequence}",
+        f"Sum of Series: {calculated_sum:.6g}",
+        "",
+    ])